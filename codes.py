@@ -1,321 +1,443 @@
-#!/usr/bin/env python3
-"""
-multi_grab_sora_codes_mt.py
-
-- Creates/uses many user_ids (cached in user_ids.json).
-- Registers missing user_ids using a ThreadPool (50 threads).
-- Starts many Socket.IO clients; emitter loops run in a ThreadPool (50 threads).
-- Each client respects its own server-provided rate limit.
-- Prints unique CODE FOUND messages (green), saves codes to codes.txt.
-"""
-import os
-import time
-import json
-import threading
-import requests
-import socketio
-import sys
-import re
-from typing import Optional, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-# ---------- CONFIG ----------
-SERVER_BASE = "https://server.escaping.work"
-REGISTER_EP = SERVER_BASE + "/register"
-USER_IDS_FILE = "user_ids.json"
-CODES_FILE = "codes.txt"
-
-DEFAULT_EMIT_INTERVAL = 1.0   # base per-client interval
-STOP_ON_FIRST = True
-COPY_TO_CLIPBOARD = False
-
-# thread counts requested
-USERID_CREATION_THREADS = 50
-CLIENT_THREADPOOL_WORKERS = 50
-
-CLIENT_CONNECT_STAGGER = 0.01  # small stagger between connect calls (seconds)
-
-# ---------- GLOBALS ----------
-seen_codes = set()
-seen_lock = threading.Lock()
-
-clients: List["ClientWrapper"] = []
-clients_lock = threading.Lock()
-
-stop_all = threading.Event()
-found_event = threading.Event()
-
-# ---------- UTILITIES ----------
-def save_codes_to_file(code: str):
-    try:
-        with open(CODES_FILE, "a") as f:
-            f.write(code + "\n")
-    except Exception as e:
-        print("[!] Failed to save code:", e)
-
-def save_user_ids_list(uids: List[str]):
-    try:
-        with open(USER_IDS_FILE, "w") as f:
-            json.dump(uids, f)
-    except Exception as e:
-        print("[!] Failed to save user ids:", e)
-
-def load_user_ids_list() -> List[str]:
-    if os.path.exists(USER_IDS_FILE):
-        try:
-            with open(USER_IDS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            return []
-    return []
-
-def try_copy_to_clipboard(text: str):
-    if not COPY_TO_CLIPBOARD:
-        return
-    try:
-        import pyperclip
-        pyperclip.copy(text)
-        print("[*] Code copied to clipboard.")
-    except Exception as e:
-        print("[!] Failed to copy to clipboard:", e)
-
-# ---------- Client wrapper ----------
-class ClientWrapper:
-    def __init__(self, user_id: str, idx: int, base_interval: float):
-        self.user_id = user_id
-        self.idx = idx
-        self.base_interval = base_interval
-        self.sio = socketio.Client(reconnection=True, logger=False, engineio_logger=False)
-        self.next_emit_time = 0.0
-        self.connected = False
-        self._lock = threading.Lock()
-        self.last_server_message = None
-        self._install_handlers()
-
-    def _install_handlers(self):
-        @self.sio.event
-        def connect():
-            self.connected = True
-            print(f"[client {self.idx}] connected")
-
-        @self.sio.event
-        def disconnect():
-            self.connected = False
-            print(f"[client {self.idx}] disconnected")
-
-        @self.sio.on('codeResponse')
-        def _on_code_response(data):
-            try:
-                if isinstance(data, dict) and data.get("success"):
-                    code = data.get("code")
-                    if not code:
-                        return
-                    with seen_lock:
-                        if code in seen_codes:
-                            return
-                        seen_codes.add(code)
-                    save_codes_to_file(code)
-                    try_copy_to_clipboard(code)
-                    print(f"\n\033[92mCODE FOUND: {code}\033[0m\n")
-                    found_event.set()
-                    if STOP_ON_FIRST:
-                        stop_all.set()
-                else:
-                    msg = data.get("message") if isinstance(data, dict) else None
-                    if msg:
-                        # extract wait seconds if any
-                        m = re.search(r'(\d+)\s*seconds?', msg, flags=re.IGNORECASE)
-                        if m:
-                            s = int(m.group(1))
-                            with self._lock:
-                                self.next_emit_time = time.time() + s
-                        # store last server message for debugging if needed
-                        self.last_server_message = msg
-            except Exception as e:
-                print(f"[client {self.idx}] error processing codeResponse:", e)
-
-        @self.sio.on('sora_error')
-        def _on_sora_error(data):
-            print(f"[client {self.idx}] sora_error: {data}")
-
-        # minimal handlers for other events (no spam)
-        @self.sio.on('inviteCount')
-        def _on_invite_count(data):
-            pass
-
-        @self.sio.on('userCount')
-        def _on_user_count(data):
-            pass
-
-    def connect(self):
-        try:
-            # non-blocking connect
-            self.sio.connect(SERVER_BASE, auth={"user_id": self.user_id}, wait=False, transports=["websocket"])
-        except Exception as e:
-            print(f"[client {self.idx}] connect failed:", e)
-
-    def run_emitter(self):
-        # emitter loop run inside threadpool worker
-        while not stop_all.is_set():
-            now = time.time()
-            with self._lock:
-                ne = self.next_emit_time
-            if now >= ne:
-                if self.sio.connected:
-                    try:
-                        self.sio.emit('getCode')
-                    except Exception:
-                        # ignore transient emit errors
-                        pass
-                # schedule next attempt
-                with self._lock:
-                    self.next_emit_time = time.time() + self.base_interval
-            time.sleep(0.05)
-
-    def disconnect(self):
-        try:
-            self.sio.disconnect()
-        except Exception:
-            pass
-
-# ---------- Manager: create/register uids (multithreaded) ----------
-def create_or_load_user_ids(desired_count: int) -> List[str]:
-    existing = load_user_ids_list()
-    if len(existing) >= desired_count:
-        return existing[:desired_count]
-
-    uids = existing[:]
-    to_create = desired_count - len(uids)
-    print(f"[manager] Need to create {to_create} new user_ids (total will be {desired_count})")
-
-    uids_lock = threading.Lock()
-    created_count = [len(uids)]
-
-    def register_one(_):
-        nonlocal created_count
-        # try until success or global stop
-        while not stop_all.is_set():
-            try:
-                r = requests.post(REGISTER_EP, timeout=15)
-                if r.status_code == 200:
-                    uid = r.text.strip()
-                    with uids_lock:
-                        uids.append(uid)
-                        created_count[0] += 1
-                        print(f"[manager] created user_id {created_count[0]}/{desired_count}")
-                    return uid
-                else:
-                    # brief delay and retry
-                    time.sleep(1)
-            except Exception:
-                time.sleep(1)
-        return None
-
-    # ThreadPool to create user ids concurrently
-    with ThreadPoolExecutor(max_workers=USERID_CREATION_THREADS) as exec:
-        futures = [exec.submit(register_one, i) for i in range(to_create)]
-        for future in as_completed(futures):
-            # if stop_all set, break
-            if stop_all.is_set():
-                break
-            # future result not strictly required here; progress printed inside
-            try:
-                future.result(timeout=0.1)
-            except Exception:
-                pass
-
-    save_user_ids_list(uids)
-    return uids[:desired_count]
-
-# ---------- Entry & orchestration ----------
-def main():
-    global STOP_ON_FIRST, COPY_TO_CLIPBOARD, DEFAULT_EMIT_INTERVAL
-
-    # ask stop on first
-    while True:
-        resp = input("Do you want to stop at the 1st code found? (yes/no): ").strip().lower()
-        if resp in ("yes", "y"):
-            STOP_ON_FIRST = True
-            break
-        if resp in ("no", "n"):
-            STOP_ON_FIRST = False
-            break
-        print("Please answer yes or no.")
-
-    # how many user ids
-    while True:
-        try:
-            n = int(input("How many user IDs to create/use? (e.g. 50, 100, 200): ").strip())
-            if n <= 0:
-                print("Enter a positive integer.")
-                continue
-            break
-        except Exception:
-            print("Please enter a valid integer.")
-
-    # parse args
-    if "--continuous" in sys.argv:
-        STOP_ON_FIRST = False
-    if "--interval" in sys.argv:
-        try:
-            idx = sys.argv.index("--interval")
-            DEFAULT_EMIT_INTERVAL = float(sys.argv[idx + 1])
-        except Exception:
-            pass
-    if "--copy" in sys.argv:
-        COPY_TO_CLIPBOARD = True
-
-    print(f"[manager] ensuring {n} user_ids (may reuse cached '{USER_IDS_FILE}')")
-    user_ids = create_or_load_user_ids(n)
-    if len(user_ids) < n:
-        print("[manager] failed to obtain enough user ids, exiting.")
-        return
-
-    # create client wrappers
-    print("[manager] creating clients...")
-    for idx, uid in enumerate(user_ids):
-        cw = ClientWrapper(uid, idx + 1, base_interval=DEFAULT_EMIT_INTERVAL)
-        with clients_lock:
-            clients.append(cw)
-
-    # use a ThreadPoolExecutor to connect clients concurrently (staggered connect)
-    print("[manager] connecting clients (thread pool)...")
-    with ThreadPoolExecutor(max_workers=CLIENT_THREADPOOL_WORKERS) as exec:
-        connect_futures = []
-        for c in clients:
-            # submit connect calls; call returns quickly because wait=False in connect
-            connect_futures.append(exec.submit(c.connect))
-            time.sleep(CLIENT_CONNECT_STAGGER)
-        # wait briefly for connections to establish
-        time.sleep(1.0)
-
-        # now start each client's emitter loop in the same executor pool
-        print("[manager] starting client emitter loops (thread pool workers)...")
-        emitter_futures = []
-        for c in clients:
-            emitter_futures.append(exec.submit(c.run_emitter))
-
-        print("[*] Looking for codes.. (press Ctrl+C to stop)")
-        try:
-            # main monitor loop
-            while not stop_all.is_set():
-                # if STOP_ON_FIRST and found_event is set, stop_all will be set by client
-                time.sleep(0.5)
-        except KeyboardInterrupt:
-            print("\n[!] Interrupted by user. Stopping...")
-            stop_all.set()
-        finally:
-            # attempt graceful disconnect
-            print("[manager] disconnecting clients...")
-            for c in clients:
-                try:
-                    c.disconnect()
-                except:
-                    pass
-            # allow futures to finish briefly
-            time.sleep(0.5)
-
-    print("[*] Finished. Found codes saved to", CODES_FILE)
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+multi_grab_sora_codes_mt.py
+
+- Creates/uses many user_ids (cached in user_ids.json); generated locally
+  by default, or registered with the server via --server-register.
+- Starts many Socket.IO clients; emitter loops run as asyncio tasks on a
+  single event loop (socketio.AsyncClient), so client count is not capped
+  by a thread pool.
+- Each client respects its own server-provided rate limit.
+- Prints unique CODE FOUND messages (green), saves codes to codes.txt.
+"""
+import os
+import time
+import json
+import atexit
+try:
+    import orjson  # optional: much faster (de)serialization of user_ids.json
+except ImportError:
+    orjson = None
+import asyncio
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+import socketio
+import sys
+import re
+import uuid
+import random
+from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# ---------- CONFIG ----------
+SERVER_BASE = "https://server.escaping.work"
+REGISTER_EP = SERVER_BASE + "/register"
+REGISTER_BULK_EP = SERVER_BASE + "/register_bulk"
+USER_IDS_FILE = "user_ids.json"
+CODES_FILE = "codes.txt"
+
+DEFAULT_EMIT_INTERVAL = 1.0   # base per-client interval
+STOP_ON_FIRST = True
+COPY_TO_CLIPBOARD = False
+# the server accepts a client-chosen user_id in the connect auth payload, so
+# ids are generated locally by default; --server-register restores the old
+# /register round trips
+SERVER_REGISTER = False
+
+# thread count for user id registration
+USERID_CREATION_THREADS = 50
+
+CLIENT_CONNECT_STAGGER = 0.01  # small stagger between connect calls (seconds)
+
+# matches "wait N seconds" style rate-limit messages; compiled once so the
+# hot codeResponse path skips the per-call pattern cache lookup
+_WAIT_RE = re.compile(r'(\d+)\s*seconds?', re.IGNORECASE)
+
+# ---------- GLOBALS ----------
+# plain dict: membership test + single-key store are each atomic under the
+# GIL, so the hot codeResponse path needs no lock
+seen_codes = {}
+
+clients: List["ClientWrapper"] = []
+clients_lock = threading.Lock()
+
+stop_all = asyncio.Event()
+found_event = asyncio.Event()
+found_q: "asyncio.Queue[str]" = asyncio.Queue()
+
+# shared HTTP session so registration reuses pooled TCP/TLS connections
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=USERID_CREATION_THREADS,
+                                      pool_maxsize=USERID_CREATION_THREADS,
+                                      max_retries=0))
+
+# ---------- UTILITIES ----------
+_codes_fp = None
+_codes_fp_lock = threading.Lock()
+
+def save_codes_to_file(code: str):
+    # keep one line-buffered append handle open instead of open/write/close
+    # per code; matters in continuous mode with many clients finding codes
+    global _codes_fp
+    try:
+        with _codes_fp_lock:
+            if _codes_fp is None:
+                _codes_fp = open(CODES_FILE, "a", buffering=1)
+                atexit.register(_codes_fp.close)
+            _codes_fp.write(code + "\n")
+    except Exception as e:
+        print("[!] Failed to save code:", e)
+
+def save_user_ids_list(uids: List[str]):
+    try:
+        if orjson is not None:
+            with open(USER_IDS_FILE, "wb") as f:
+                f.write(orjson.dumps(uids))
+        else:
+            with open(USER_IDS_FILE, "w") as f:
+                json.dump(uids, f)
+    except Exception as e:
+        print("[!] Failed to save user ids:", e)
+
+def load_user_ids_list() -> List[str]:
+    if os.path.exists(USER_IDS_FILE):
+        try:
+            with open(USER_IDS_FILE, "rb") as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception:
+            return []
+    return []
+
+def try_copy_to_clipboard(text: str):
+    if not COPY_TO_CLIPBOARD:
+        return
+    try:
+        import pyperclip
+        pyperclip.copy(text)
+        print("[*] Code copied to clipboard.")
+    except Exception as e:
+        print("[!] Failed to copy to clipboard:", e)
+
+# ---------- Client wrapper ----------
+class ClientWrapper:
+    def __init__(self, user_id: str, idx: int, base_interval: float):
+        self.user_id = user_id
+        self.idx = idx
+        # jitter the interval per client so the fleet doesn't drift into
+        # phase-aligned emit spikes that get rate-limited together
+        self.base_interval = base_interval * random.uniform(0.85, 1.15)
+        # retry forever but cap the backoff at 5s (with jitter) so a server
+        # blip doesn't leave clients sleeping for minutes between attempts
+        self.sio = socketio.AsyncClient(reconnection=True,
+                                        reconnection_attempts=0,
+                                        reconnection_delay=1,
+                                        reconnection_delay_max=5,
+                                        randomization_factor=0.5,
+                                        logger=False, engineio_logger=False)
+        # plain float: attribute reads/writes are atomic under the GIL (and
+        # everything touching it runs on the event loop), so no lock needed
+        self._next_allowed = 0.0
+        self.connected = False
+        self.last_server_message = None
+        self._install_handlers()
+
+    def _install_handlers(self):
+        @self.sio.event
+        async def connect():
+            self.connected = True
+            print(f"[client {self.idx}] connected")
+
+        @self.sio.event
+        async def disconnect():
+            self.connected = False
+            print(f"[client {self.idx}] disconnected")
+
+        @self.sio.on('codeResponse')
+        async def _on_code_response(data):
+            try:
+                if isinstance(data, dict) and data.get("success"):
+                    code = data.get("code")
+                    if not code:
+                        return
+                    if code in seen_codes:
+                        return
+                    seen_codes[code] = 1
+                    # hand file/clipboard/stdout work to the consumer task so
+                    # the receive path returns to the socket immediately
+                    found_q.put_nowait(code)
+                    found_event.set()
+                    if STOP_ON_FIRST:
+                        stop_all.set()
+                else:
+                    msg = data.get("message") if isinstance(data, dict) else None
+                    if msg:
+                        # extract wait seconds if any
+                        m = _WAIT_RE.search(msg)
+                        if m:
+                            # server-provided wait is our Retry-After; add a
+                            # little jitter so clients don't retry in lockstep
+                            s = int(m.group(1))
+                            self._next_allowed = max(self._next_allowed,
+                                                     time.time() + s + random.uniform(0, 0.25))
+                        # store last server message for debugging if needed
+                        self.last_server_message = msg
+            except Exception as e:
+                print(f"[client {self.idx}] error processing codeResponse:", e)
+
+        @self.sio.on('sora_error')
+        async def _on_sora_error(data):
+            print(f"[client {self.idx}] sora_error: {data}")
+
+        # minimal handlers for other events (no spam)
+        @self.sio.on('inviteCount')
+        async def _on_invite_count(data):
+            pass
+
+        @self.sio.on('userCount')
+        async def _on_user_count(data):
+            pass
+
+    async def connect(self):
+        try:
+            # non-blocking connect
+            await self.sio.connect(SERVER_BASE, auth={"user_id": self.user_id}, wait=False, transports=["websocket"])
+        except Exception as e:
+            print(f"[client {self.idx}] connect failed:", e)
+
+    async def run(self):
+        # one task owns the client's whole lifetime (connect + emit loop) so
+        # all of its state stays on a single coroutine
+        # stagger connects inside the task so launching N clients is instant
+        await asyncio.sleep((self.idx - 1) * CLIENT_CONNECT_STAGGER)
+        await self.connect()
+        # give the connection a moment to establish before emitting
+        await asyncio.sleep(1.0)
+        await self.run_emitter()
+
+    async def run_emitter(self):
+        # token-bucket style: sleep exactly until the next allowed emit; the
+        # wait doubles as the stop signal so no polling is needed
+        while not stop_all.is_set():
+            wait = self._next_allowed - time.time()
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(stop_all.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            if self.sio.connected:
+                try:
+                    await self.sio.emit('getCode')
+                except Exception:
+                    # ignore transient emit errors
+                    pass
+            # schedule next attempt (small jitter keeps clients de-phased)
+            self._next_allowed = time.time() + self.base_interval + random.uniform(-0.05, 0.05)
+
+    async def disconnect(self):
+        try:
+            await self.sio.disconnect()
+        except Exception:
+            pass
+
+# ---------- Manager: create/register uids (multithreaded) ----------
+def register_bulk(count: int) -> Optional[List[str]]:
+    # single batch request instead of `count` individual POSTs; returns None
+    # if the server doesn't support the bulk endpoint
+    try:
+        r = session.post(REGISTER_BULK_EP, json={"count": count}, timeout=30)
+        if r.status_code in (404, 405):
+            return None
+        if r.status_code == 200:
+            uids = r.json()
+            if isinstance(uids, list):
+                return [str(u).strip() for u in uids]
+    except Exception as e:
+        print("[manager] bulk registration failed:", e)
+    return None
+
+def create_or_load_user_ids(desired_count: int) -> List[str]:
+    existing = load_user_ids_list()
+    if len(existing) >= desired_count:
+        return existing[:desired_count]
+
+    uids = existing[:]
+    to_create = desired_count - len(uids)
+    print(f"[manager] Need to create {to_create} new user_ids (total will be {desired_count})")
+
+    # default: mint ids locally, no network round trips at all
+    if not SERVER_REGISTER:
+        uids.extend(uuid.uuid4().hex for _ in range(to_create))
+        print(f"[manager] generated {to_create} user_ids locally")
+        save_user_ids_list(uids)
+        return uids[:desired_count]
+
+    # try the bulk endpoint first; fall back to per-uid registration
+    bulk = register_bulk(to_create)
+    if bulk:
+        uids.extend(bulk)
+        print(f"[manager] created {len(bulk)} user_ids via bulk registration")
+        save_user_ids_list(uids)
+        return uids[:desired_count]
+
+    uids_lock = threading.Lock()
+    created_count = [len(uids)]
+
+    def register_one(_):
+        nonlocal created_count
+        attempts = 0
+        # try until success or global stop
+        while not stop_all.is_set():
+            retry_after = None
+            try:
+                r = session.post(REGISTER_EP, timeout=15)
+                if r.status_code == 200:
+                    uid = r.text.strip()
+                    with uids_lock:
+                        uids.append(uid)
+                        created_count[0] += 1
+                        print(f"[manager] created user_id {created_count[0]}/{desired_count}")
+                    return uid
+                retry_after = r.headers.get("Retry-After")
+            except Exception:
+                pass
+            # capped exponential backoff with jitter so 50 threads don't
+            # hammer the server in lockstep; prefer the server's Retry-After
+            delay = min(30, (2 ** attempts) * 0.25) + random.uniform(0, 0.25)
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    pass
+            attempts += 1
+            time.sleep(delay)
+        return None
+
+    # ThreadPool to create user ids concurrently
+    with ThreadPoolExecutor(max_workers=USERID_CREATION_THREADS) as exec:
+        futures = [exec.submit(register_one, i) for i in range(to_create)]
+        for future in as_completed(futures):
+            # if stop_all set, break
+            if stop_all.is_set():
+                break
+            # future result not strictly required here; progress printed inside
+            try:
+                future.result(timeout=0.1)
+            except Exception:
+                pass
+
+    save_user_ids_list(uids)
+    return uids[:desired_count]
+
+# ---------- Entry & orchestration ----------
+def _process_found(code: str):
+    save_codes_to_file(code)
+    try_copy_to_clipboard(code)
+    print(f"\n\033[92mCODE FOUND: {code}\033[0m\n")
+
+async def _found_consumer():
+    # single consumer drains found codes off the receive path
+    while True:
+        _process_found(await found_q.get())
+
+async def run_clients(user_ids: List[str]):
+    # create client wrappers
+    print("[manager] creating clients...")
+    for idx, uid in enumerate(user_ids):
+        cw = ClientWrapper(uid, idx + 1, base_interval=DEFAULT_EMIT_INTERVAL)
+        with clients_lock:
+            clients.append(cw)
+
+    # one task per client owns connect + emit loop; each task staggers its
+    # own connect, so launching doesn't serialize on the manager
+    print("[manager] starting clients (one asyncio task each)...")
+    consumer_task = asyncio.ensure_future(_found_consumer())
+    client_tasks = [asyncio.ensure_future(c.run()) for c in clients]
+
+    print("[*] Looking for codes.. (press Ctrl+C to stop)")
+    try:
+        # block until stop_all is set (by a client on STOP_ON_FIRST, or by
+        # the interrupt handler); no periodic wakeups
+        await stop_all.wait()
+    except asyncio.CancelledError:
+        print("\n[!] Interrupted by user. Stopping...")
+        stop_all.set()
+    finally:
+        # attempt graceful disconnect
+        print("[manager] disconnecting clients...")
+        for c in clients:
+            try:
+                await c.disconnect()
+            except:
+                pass
+        # allow client tasks to finish briefly
+        await asyncio.gather(*client_tasks, return_exceptions=True)
+        consumer_task.cancel()
+        # flush any codes still queued at shutdown
+        while not found_q.empty():
+            _process_found(found_q.get_nowait())
+
+def main():
+    global STOP_ON_FIRST, COPY_TO_CLIPBOARD, DEFAULT_EMIT_INTERVAL, SERVER_REGISTER
+
+    # ask stop on first
+    while True:
+        resp = input("Do you want to stop at the 1st code found? (yes/no): ").strip().lower()
+        if resp in ("yes", "y"):
+            STOP_ON_FIRST = True
+            break
+        if resp in ("no", "n"):
+            STOP_ON_FIRST = False
+            break
+        print("Please answer yes or no.")
+
+    # how many user ids
+    while True:
+        try:
+            n = int(input("How many user IDs to create/use? (e.g. 50, 100, 200): ").strip())
+            if n <= 0:
+                print("Enter a positive integer.")
+                continue
+            break
+        except Exception:
+            print("Please enter a valid integer.")
+
+    # parse args
+    if "--continuous" in sys.argv:
+        STOP_ON_FIRST = False
+    if "--interval" in sys.argv:
+        try:
+            idx = sys.argv.index("--interval")
+            DEFAULT_EMIT_INTERVAL = float(sys.argv[idx + 1])
+        except Exception:
+            pass
+    if "--copy" in sys.argv:
+        COPY_TO_CLIPBOARD = True
+    if "--server-register" in sys.argv:
+        SERVER_REGISTER = True
+
+    print(f"[manager] ensuring {n} user_ids (may reuse cached '{USER_IDS_FILE}')")
+    user_ids = create_or_load_user_ids(n)
+    if len(user_ids) < n:
+        print("[manager] failed to obtain enough user ids, exiting.")
+        return
+
+    # optional faster event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except Exception:
+        pass
+
+    try:
+        asyncio.run(run_clients(user_ids))
+    except KeyboardInterrupt:
+        print("\n[!] Interrupted by user.")
+        stop_all.set()
+
+    print("[*] Finished. Found codes saved to", CODES_FILE)
+
+if __name__ == "__main__":
+    main()